@@ -33,6 +33,12 @@ Requirements:
 Assumptions:
     1) a person can not be assigned to themself (this does not need to be configured)
 
+Config cache:
+    Parsed configurations are cached in $XDG_CACHE_HOME/secret_santa (default
+    ~/.cache/secret_santa) and reused while the config file is unchanged. The
+    administrator password is never written to the cache. Delete the directory
+    to clear it.
+
 Example print assignments:
     Assignment Id: 21f7d68
     name1 will give to name4.
@@ -43,61 +49,139 @@ Example print assignments:
     name6 will give to name3.
 """
 
+import atexit
+import collections
+import functools
+import hashlib
+import os
+import pickle
+import queue
 import random
-import smtplib
+import re
+import secrets
 import sys
-import uuid
+import tempfile
+import threading
+import time
+# smtplib, email and concurrent.futures are imported on first use so print mode starts without them
 
 MAX_ASSIGNMENT_UUID_LENGTH = 7
 MAX_ASSIGNMENT_ATTEMPTS = 3
+SMTP_HOST = 'smtp.gmail.com'
+SMTP_PORT = 587
+MAX_SMTP_CONNECTIONS = 10
+MAX_MESSAGES_PER_SMTP_CONNECTION = 100
+SMTP_OK_CODE = 250
+TRANSIENT_SMTP_CODES = (421, 450, 454)
+MAX_SEND_RETRIES = 3
+INITIAL_RETRY_BACKOFF_SECONDS = 1
+ABORT_BATCH_MIN_SIZE = 30
 ADMINISTRATOR_EMAIL_KEY = 'administrator_email'
 ADMINISTRATOR_EMAIL_PASSWORD_KEY = 'administrator_email_password'
 PARTICIPANTS_KEY = 'participants'
 PARTICIPANT_NAME_KEY = 'name'
 PARTICIPANT_EMAIL_KEY = 'email'
 PARTICIPANT_ASSIGNMENT_EXCLUSIONS_KEY = 'exclusion_ids'
+PARTICIPANT_LINE_PATTERN = re.compile(r'^\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*\(([^)]*)\)\s*$')
+CONFIG_CACHE_DIRECTORY = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'secret_santa')
 
+def read_administrator_password(config_filename):
+    with open(config_filename, 'r') as cfg_file:
+        cfg_file.readline()
+        return cfg_file.readline().strip()
+
+def cache_parsed_config(parse):
+    @functools.wraps(parse)
+    def cached_parse(config_filename):
+        # the parser's own mtime is part of the key so a changed parser never reads stale results
+        config_stat = os.stat(config_filename)
+        cache_key = (config_stat.st_mtime_ns, config_stat.st_size, os.stat(__file__).st_mtime_ns)
+        cache_filename = os.path.join(CONFIG_CACHE_DIRECTORY, '%s.pkl' % hashlib.sha1(os.path.abspath(config_filename).encode()).hexdigest())
+
+        try:
+            with open(cache_filename, 'rb') as cache_file:
+                # never unpickle a file that someone else could have written
+                cache_stat = os.fstat(cache_file.fileno())
+                if cache_stat.st_mode & 0o022 or (hasattr(os, 'getuid') and cache_stat.st_uid != os.getuid()):
+                    raise PermissionError(cache_filename)
+                cached_key, config = pickle.load(cache_file)
+            if cached_key == cache_key:
+                # the password is never cached, so it is read back from the configuration itself
+                config[ADMINISTRATOR_EMAIL_PASSWORD_KEY] = read_administrator_password(config_filename)
+                return config
+        except Exception:
+            pass # missing, unreadable or untrusted cache is simply rebuilt
+
+        # only successfully parsed configurations are cached
+        config = parse(config_filename)
+        cached_config = {key: value for key, value in config.items() if key != ADMINISTRATOR_EMAIL_PASSWORD_KEY}
+
+        try:
+            os.makedirs(CONFIG_CACHE_DIRECTORY, mode=0o700, exist_ok=True)
+            os.chmod(CONFIG_CACHE_DIRECTORY, 0o700) # makedirs only applies the mode on creation
+            fd, temporary_filename = tempfile.mkstemp(dir=CONFIG_CACHE_DIRECTORY, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as cache_file:
+                    pickle.dump((cache_key, cached_config), cache_file)
+                os.replace(temporary_filename, cache_filename)
+            except BaseException:
+                os.unlink(temporary_filename)
+                raise
+        except OSError:
+            pass # caching is best effort
+
+        return config
+
+    return cached_parse
+
+@cache_parsed_config
 def parse_config_file(config_filename):
     config = {}
-    all_exclusion_ids = set()
+    pending_exclusion_checks = [] # (line_number, exclusion_id) verified once all participants are known
 
+    # the configuration is small, so read it with a single call instead of line by line
     with open(config_filename, 'r') as cfg_file:
-        for line_number, line in enumerate(cfg_file):
-            if line_number == 0:
-                config[ADMINISTRATOR_EMAIL_KEY] = line.strip()
-            elif line_number == 1:
-                config[ADMINISTRATOR_EMAIL_PASSWORD_KEY] = line
-            else:
-                if not line.strip():
-                    continue
-
-                person_id, name, email, assignment_exclusions = map(str.strip, line.split(','))
-
-                # check exclusion formatting
-                if not assignment_exclusions or assignment_exclusions[0] != '(' or assignment_exclusions[-1] != ')':
-                    raise Exception("assignment_exclusions=(%s) is not formatted with parentheses in the configuration." % assignment_exclusions)
+        lines = cfg_file.read().split('\n')
 
-                # extract exclusions within parentheses as set
-                exclusion_ids = set(map(str.strip, assignment_exclusions[1:-1].split(';')))
-                if '' in exclusion_ids:
-                    exclusion_ids.remove('') # derives from empty parentheses
-                exclusion_ids.add(person_id) # a person can not be assigned to themself
-                all_exclusion_ids.update(exclusion_ids)
-
-                config.setdefault(PARTICIPANTS_KEY, {})
-                if person_id in config[PARTICIPANTS_KEY]:
-                    raise Exception("person_id=(%s) has appeared more than once in the configuration." % person_id)
-
-                config[PARTICIPANTS_KEY][person_id] = {
-                    PARTICIPANT_NAME_KEY: name,
-                    PARTICIPANT_EMAIL_KEY: email,
-                    PARTICIPANT_ASSIGNMENT_EXCLUSIONS_KEY: exclusion_ids
-                }
-
-    all_participants = set(config[PARTICIPANTS_KEY].keys())
-    unknown_exclusion_ids = all_exclusion_ids - all_participants
-    if unknown_exclusion_ids:
-        raise Exception("Assignment exclusions reference unknown participants=(%s)." % unknown_exclusion_ids)
+    for line_number, line in enumerate(lines):
+        if line_number == 0:
+            config[ADMINISTRATOR_EMAIL_KEY] = line.strip()
+        elif line_number == 1:
+            config[ADMINISTRATOR_EMAIL_PASSWORD_KEY] = line.strip()
+        else:
+            if not line.strip():
+                continue
+
+            # one match extracts every field and enforces the exclusion parentheses
+            match = PARTICIPANT_LINE_PATTERN.match(line)
+            if not match:
+                raise Exception("line=(%s) is not formatted as person_id, name, email, (assignment_exclusions) in the configuration." % line.strip())
+            person_id, name, email, assignment_exclusions = match.groups()
+            person_id = sys.intern(person_id) # ids are hashed and compared repeatedly during assignment
+
+            # exclusion sets are read-only after parsing; a person can not be assigned to themself
+            if not assignment_exclusions.strip():
+                exclusion_ids = frozenset((person_id,)) # common case of empty parentheses
+            else:
+                exclusion_ids = {sys.intern(exclusion_id.strip()) for exclusion_id in assignment_exclusions.split(';') if exclusion_id.strip()}
+                pending_exclusion_checks.extend((line_number + 1, exclusion_id) for exclusion_id in exclusion_ids)
+                exclusion_ids.add(person_id)
+                exclusion_ids = frozenset(exclusion_ids)
+
+            config.setdefault(PARTICIPANTS_KEY, {})
+            if person_id in config[PARTICIPANTS_KEY]:
+                raise Exception("person_id=(%s) has appeared more than once in the configuration." % person_id)
+
+            config[PARTICIPANTS_KEY][person_id] = {
+                PARTICIPANT_NAME_KEY: name,
+                PARTICIPANT_EMAIL_KEY: email,
+                PARTICIPANT_ASSIGNMENT_EXCLUSIONS_KEY: exclusion_ids
+            }
+
+    participants = config.get(PARTICIPANTS_KEY, {})
+    unknown_exclusions = ["%s (line %s)" % (exclusion_id, line_number) for line_number, exclusion_id in pending_exclusion_checks if exclusion_id not in participants]
+    if unknown_exclusions:
+        raise Exception("Assignment exclusions reference unknown participants=(%s)." % ', '.join(unknown_exclusions))
 
     if ADMINISTRATOR_EMAIL_KEY not in config:
         raise Exception("Missing administrator email in configuration file.")
@@ -108,31 +192,115 @@ def parse_config_file(config_filename):
 
     return config
 
+class ExclusionsInfeasible(Exception):
+    pass
+
+def augment_matching(root, allowed, distances, matched_getters, matched_givers):
+    # iterative depth first search for an augmenting path along the bfs layers
+    stack = [(root, iter(allowed[root]))]
+    path = []
+    while stack:
+        giver, getters = stack[-1]
+        for getter in getters:
+            other_giver = matched_givers.get(getter)
+            if other_giver is None:
+                path.append(getter)
+                for (path_giver, _), path_getter in zip(stack, path):
+                    matched_getters[path_giver] = path_getter
+                    matched_givers[path_getter] = path_giver
+                return True
+            if distances.get(other_giver) == distances[giver] + 1:
+                path.append(getter)
+                stack.append((other_giver, iter(allowed[other_giver])))
+                break
+        else:
+            distances[giver] = None # dead end for this phase
+            stack.pop()
+            if path:
+                path.pop()
+
+    return False
+
+def greedy_matching(givers, participant_data):
+    # remaining getters live in a list so a pick is a random index plus a swap-remove,
+    # instead of building a filtered set and tuple for every giver
+    remaining_participants = list(participant_data.keys())
+    matched_getters = {}
+
+    for giver in givers:
+        assignment_exclusions = participant_data[giver][PARTICIPANT_ASSIGNMENT_EXCLUSIONS_KEY]
+
+        for _ in range(len(remaining_participants)):
+            index = random.randrange(len(remaining_participants))
+            if remaining_participants[index] not in assignment_exclusions:
+                break
+        else:
+            # rejection sampling kept hitting exclusions; scan for the allowed getters instead
+            available_indices = [index for index, participant in enumerate(remaining_participants) if participant not in assignment_exclusions]
+            if not available_indices:
+                continue # dead end; the caller retries or repairs it with the matching
+            index = random.choice(available_indices)
+
+        matched_getters[giver] = remaining_participants[index]
+        remaining_participants[index] = remaining_participants[-1]
+        remaining_participants.pop()
+
+    return matched_getters
+
+def maximum_matching(allowed, matched_getters):
+    # hopcroft-karp: O(E * sqrt(V)), extending the given partial matching
+    matched_getters = dict(matched_getters) # giver mapped to getter
+    matched_givers = {getter: giver for giver, getter in matched_getters.items()} # getter mapped to giver
+
+    while True:
+        distances = {giver: 0 for giver in allowed if giver not in matched_getters}
+        frontier = collections.deque(distances)
+        found_free_getter = False
+        while frontier:
+            giver = frontier.popleft()
+            for getter in allowed[giver]:
+                other_giver = matched_givers.get(getter)
+                if other_giver is None:
+                    found_free_getter = True
+                elif other_giver not in distances:
+                    distances[other_giver] = distances[giver] + 1
+                    frontier.append(other_giver)
+
+        if not found_free_getter:
+            return matched_getters
+
+        for giver in allowed:
+            if giver not in matched_getters:
+                augment_matching(giver, allowed, distances, matched_getters, matched_givers)
+
 def get_assignments(config):
     participant_data = config[PARTICIPANTS_KEY]
 
-    # randomize order of assignment
-    all_participants_randomized = list(participant_data.keys())
-    random.shuffle(all_participants_randomized)
-
-    # starts out with all participants
-    remaining_participants = set(participant_data.keys())
+    givers = list(participant_data.keys())
+
+    # randomized greedy restarts draw close to uniformly among all valid assignments
+    for _ in range(MAX_ASSIGNMENT_ATTEMPTS + 1):
+        random.shuffle(givers)
+        assignments = greedy_matching(givers, participant_data)
+        if len(assignments) == len(givers):
+            # giver mapped to getter
+            return {giver: assignments[giver] for giver in givers}
+
+    # exclusions are too tight for the greedy draws; the matching either repairs the
+    # last draw or proves that no assignment exists. Its structure would bias which
+    # assignment is found, so it is only used here
+    allowed = {}
+    for giver in givers:
+        assignment_exclusions = participant_data[giver][PARTICIPANT_ASSIGNMENT_EXCLUSIONS_KEY]
+        allowed[giver] = [getter for getter in participant_data if getter not in assignment_exclusions]
+
+    assignments = maximum_matching(allowed, assignments)
+    if len(assignments) < len(givers):
+        unmatched_givers = set(givers) - set(assignments)
+        raise ExclusionsInfeasible("Assignment restrictions cannot be met for participants=(%s). Please modify the configuration file." % unmatched_givers)
 
     # giver mapped to getter
-    assignments = {}
-
-    for participant in all_participants_randomized:
-        assignment_exclusions = participant_data[participant][PARTICIPANT_ASSIGNMENT_EXCLUSIONS_KEY]
-        available_participants = remaining_participants - assignment_exclusions
-
-        if not available_participants:
-            return None
-
-        assignment = random.choice(tuple(available_participants))
-        remaining_participants.remove(assignment)
-        assignments[participant] = assignment
-
-    return assignments
+    return {giver: assignments[giver] for giver in givers}
 
 def pretty_print_assignments(assignment_uuid, assignments, config):
     print("Assignment Id: %s" % assignment_uuid)
@@ -147,54 +315,249 @@ def get_email_content(email_content_filename):
 
     return None
 
+def build_email_message(subject, from_addr, to_addr, content):
+    from email.message import EmailMessage
+
+    message = EmailMessage()
+    message['Subject'] = subject
+    message['From'] = from_addr
+    message['To'] = to_addr
+    message.set_content(content)
+    return message
+
 def generate_administrator_email_message(assignment_uuid, assignments_by_name, administrator_email):
     subject = "Secret Santa Assignments (%s)" % assignment_uuid
 
-    content = ''
-    for giver, getter in assignments_by_name.items():
-        content += "%s will give to %s.\r\n" % (giver, getter)
+    content = ''.join("%s will give to %s.\r\n" % (giver, getter) for giver, getter in assignments_by_name.items())
 
-    message = 'Subject: {}\n\n{}'.format(subject, content)
-    return message
+    return build_email_message(subject, administrator_email, administrator_email, content)
+
+# idle authenticated sessions kept alive between batches, keyed by credentials
+_SMTP_CACHE = {}
+_SMTP_CACHE_LOCK = threading.Lock()
 
-def send_assignment_emails(assignment_uuid, assignments, config, email_content):
+def close_smtp_session(server):
+    import smtplib
+
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+def _connect_smtp(email, password):
+    import smtplib
+
+    server = smtplib.SMTP(SMTP_HOST, SMTP_PORT)
+    server.starttls()
+    server.login(email, password)
+    return server
+
+def _get_smtp(email, password):
+    import smtplib
+
+    while True:
+        with _SMTP_CACHE_LOCK:
+            idle_sessions = _SMTP_CACHE.get((email, password))
+            if not idle_sessions:
+                break
+            server, message_count = idle_sessions.pop()
+
+        # reuse the cached session only if the server still answers
+        try:
+            if server.noop()[0] == SMTP_OK_CODE:
+                return server, message_count
+        except (smtplib.SMTPException, OSError):
+            pass
+        server.close()
+
+    return _connect_smtp(email, password), 0
+
+def _release_smtp(email, password, server, message_count):
+    with _SMTP_CACHE_LOCK:
+        _SMTP_CACHE.setdefault((email, password), []).append((server, message_count))
+
+@atexit.register
+def _close_cached_smtp_sessions():
+    with _SMTP_CACHE_LOCK:
+        idle_sessions = [server for sessions in _SMTP_CACHE.values() for server, _ in sessions]
+        _SMTP_CACHE.clear()
+
+    for server in idle_sessions:
+        close_smtp_session(server)
+
+class SMTPPool:
+    """
+    Pool of authenticated SMTP sessions shared by the sending threads.
+
+    One session is authenticated when the pool is created, so bad credentials
+    fail before anything is sent. Further sessions are taken from the keep-alive
+    cache or opened on demand, so the pool never holds more sessions than there
+    are threads sending concurrently. Each session is recycled after
+    MAX_MESSAGES_PER_SMTP_CONNECTION messages to respect provider limits, and is
+    returned to the cache when the pool closes.
+    """
+
+    def __init__(self, email, password):
+        self.email = email
+        self.password = password
+        self._sessions = queue.Queue()
+        self._sessions.put(_get_smtp(email, password))
+
+    def send_message(self, message, to_addrs=None):
+        import smtplib
+
+        try:
+            server, message_count = self._sessions.get_nowait()
+        except queue.Empty:
+            server, message_count = _get_smtp(self.email, self.password)
+
+        if message_count >= MAX_MESSAGES_PER_SMTP_CONNECTION:
+            close_smtp_session(server)
+            server, message_count = _connect_smtp(self.email, self.password), 0
+
+        try:
+            server.send_message(message, to_addrs=to_addrs)
+        except Exception as e:
+            # only a dropped or closing connection is discarded; a rejected message leaves the session usable.
+            # smtplib errors derive from OSError, so a plain socket error is told apart explicitly
+            if isinstance(e, smtplib.SMTPResponseException):
+                session_broken = e.smtp_code == 421
+            else:
+                session_broken = isinstance(e, smtplib.SMTPServerDisconnected) or (isinstance(e, OSError) and not isinstance(e, smtplib.SMTPException))
+
+            if session_broken:
+                close_smtp_session(server)
+            else:
+                self._sessions.put((server, message_count + 1))
+            raise
+
+        self._sessions.put((server, message_count + 1))
+
+    def close(self):
+        while True:
+            try:
+                server, message_count = self._sessions.get_nowait()
+            except queue.Empty:
+                return
+            _release_smtp(self.email, self.password, server, message_count)
+
+class AbortBatch(Exception):
+    pass
+
+def send_with_retries(pool, message, to_addrs=None):
+    import smtplib
+
+    # transient rejections (rate limits, temporary failures) are retried with exponential backoff
+    backoff = INITIAL_RETRY_BACKOFF_SECONDS
+    for attempt in range(MAX_SEND_RETRIES + 1):
+        try:
+            return pool.send_message(message, to_addrs)
+        except smtplib.SMTPResponseException as e:
+            if e.smtp_code not in TRANSIENT_SMTP_CODES or attempt == MAX_SEND_RETRIES:
+                raise
+        time.sleep(backoff)
+        backoff *= 2
+
+def send_assignment_emails(assignment_uuid, assignments, config, email_content, server=None):
+    import smtplib
+    from concurrent.futures import ThreadPoolExecutor, as_completed
 
     administrator_email = config[ADMINISTRATOR_EMAIL_KEY]
     administrator_password = config[ADMINISTRATOR_EMAIL_PASSWORD_KEY]
 
-    server = smtplib.SMTP('smtp.gmail.com', 587)
-    server.starttls()
-    server.login(administrator_email, administrator_password)
+    # an injected session is handed over to the keep-alive cache and reused first
+    if server is not None:
+        _release_smtp(administrator_email, administrator_password, server, 0)
+
+    pool = SMTPPool(administrator_email, administrator_password)
 
     try:
+        # flat lookup tables so each email costs one dict lookup per field
+        participants = config[PARTICIPANTS_KEY]
+        names = {participant: data[PARTICIPANT_NAME_KEY] for participant, data in participants.items()}
+        emails = {participant: data[PARTICIPANT_EMAIL_KEY] for participant, data in participants.items()}
+
         subject = "Alert: Secret Santa Assignment (%s)" % assignment_uuid
+        content_suffix = "\r\n\r\n%s" % email_content if email_content else '' # identical for every participant
 
-        # send emails to each participant
-        assignments_by_name = {}
-        for giver, getter in assignments.items():
-            giver_name = config[PARTICIPANTS_KEY][giver][PARTICIPANT_NAME_KEY]
-            getter_name = config[PARTICIPANTS_KEY][getter][PARTICIPANT_NAME_KEY]
-            assignments_by_name[giver_name] = getter_name
+        def send_one(giver, getter):
+            recipient_email = emails[giver]
+            content = "%s will give to %s.%s" % (names[giver], names[getter], content_suffix)
 
-            recipient_email = config[PARTICIPANTS_KEY][giver][PARTICIPANT_EMAIL_KEY]
-            content = "%s will give to %s." % (giver_name, getter_name)
-            if email_content:
-                content += "\r\n\r\n%s" % email_content
+            send_with_retries(pool, build_email_message(subject, administrator_email, recipient_email, content))
 
-            message = 'Subject: {}\n\n{}'.format(subject, content)
-            server.sendmail(administrator_email, recipient_email, message)
-            print("Sent assignment to %s." % recipient_email)
+        assignments_by_name = {names[giver]: names[getter] for giver, getter in assignments.items()}
 
-        # send email to administrator with complete assignment mapping
+        # send emails to each participant concurrently, one session per worker
+        with ThreadPoolExecutor(max_workers=min(len(assignments), MAX_SMTP_CONNECTIONS)) as executor:
+            futures = {executor.submit(send_one, giver, getter): emails[giver] for giver, getter in assignments.items()}
+
+            failed = 0
+            abort_error = None
+            reported_futures = set()
+
+            def report(future):
+                reported_futures.add(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    print("Failed to send assignment to %s: %s" % (futures[future], e))
+                    return e
+                print("Sent assignment to %s." % futures[future])
+                return None
+
+            for future in as_completed(futures):
+                error = report(future)
+                if error is None:
+                    continue
+
+                failed += 1
+                if isinstance(error, smtplib.SMTPAuthenticationError):
+                    # retrying logins with rejected credentials risks locking the account
+                    abort_error = error
+                elif len(assignments) >= ABORT_BATCH_MIN_SIZE and failed > len(assignments) // 3:
+                    # stop hammering a provider that is rejecting a large share of the batch
+                    abort_error = AbortBatch("Aborted sending after %s of %s assignments failed." % (failed, len(assignments)))
+
+                if abort_error is not None:
+                    for pending_future in futures:
+                        pending_future.cancel()
+                    break
+
+        # sends already running when the batch was aborted finish when the executor shuts down
+        for future in futures:
+            if future.done() and not future.cancelled() and future not in reported_futures:
+                if report(future) is not None:
+                    failed += 1
+
+        # send email to administrator with complete assignment mapping, even after failures,
+        # so assignments that did go out can still be traced
         administrator_email_message = generate_administrator_email_message(assignment_uuid, assignments_by_name, administrator_email)
-        server.sendmail(administrator_email, administrator_email, administrator_email_message)
-        print("Sent all assignments to %s." % administrator_email)
+        try:
+            send_with_retries(pool, administrator_email_message, [administrator_email])
+        except Exception as summary_error:
+            pretty_print_assignments(assignment_uuid, assignments, config)
+            if abort_error is not None:
+                raise abort_error from summary_error
+            raise
 
+        if failed:
+            print("Sent assignment mapping to %s; %s of %s assignments failed." % (administrator_email, failed, len(assignments)))
+        else:
+            print("Sent all assignments to %s." % administrator_email)
+
+        if abort_error is not None:
+            raise abort_error
+        if failed:
+            raise Exception("Failed to send %s of %s assignments." % (failed, len(assignments)))
+
+    except AbortBatch:
+        raise
     except Exception as e:
         print(e)
-        raise Exception('Failed to send all e-mails successfully.')
+        raise Exception('Failed to send all e-mails successfully.') from e
     finally:
-        server.quit()
+        pool.close()
 
 if __name__ == '__main__':
     if len(sys.argv) not in [2, 3]:
@@ -216,17 +579,10 @@ if __name__ == '__main__':
 
         config = parse_config_file(config_filename)
 
-        attempts = 0
-        assignments = None
-        while attempts <= MAX_ASSIGNMENT_ATTEMPTS and not assignments:
-            assignments = get_assignments(config)
-            attempts += 1
-
-        if not assignments:
-            raise Exception("Assignment restrictions cannot be easily met; attempts=%s. Please modify the configuration file." % attempts)
+        assignments = get_assignments(config)
 
         # global unique identifier for this set of assignments
-        assignment_uuid = str(uuid.uuid4().hex[:MAX_ASSIGNMENT_UUID_LENGTH])
+        assignment_uuid = secrets.token_hex((MAX_ASSIGNMENT_UUID_LENGTH + 1) // 2)[:MAX_ASSIGNMENT_UUID_LENGTH]
 
         if should_send_email:
             email_content = get_email_content(email_content_filename)